@@ -198,6 +198,8 @@ class Triangle(Shape):
 
 ### CLASS GROUP ###
 class Group(Shape):
+    lazy_load = True
+
     def __init__(self, point=None, color=None, length=INITIAL_SIZE, activate=False, width=None, height=None):
         if point is None:
             point = QPoint(0, 0)
@@ -205,13 +207,30 @@ class Group(Shape):
             color = QColor(Qt.black)
         super().__init__(point, color, length=length, activate=activate, width=width, height=height)
         self._childrens = []
+        self._lazy_items = None
 
     def __len__(self):
+        self._materialize()
         return len(self._childrens)
 
     def __getitem__(self, item) -> Shape:
+        self._materialize()
         return self._childrens[item]
 
+    @property
+    def is_lazy(self):
+        return self._lazy_items is not None
+
+    def _materialize(self):
+        if self._lazy_items is None:
+            return
+        items, self._lazy_items = self._lazy_items, None
+        for item in items:
+            child = Shape.load(item)
+            if child is not None:
+                child._activate = self._activate
+                self._childrens.append(child)
+
     def _updateRect(self) -> QRect:
         self._rect = QRect()
         if self._childrens:
@@ -226,36 +245,51 @@ class Group(Shape):
         painter.setPen(QPen(pen_color, 0, Qt.DashLine))
         painter.setBrush(QBrush(self.color, brush_style))
         painter.drawRect(self._rect)
+        if self.is_lazy:
+            # placeholder until the children are actually needed
+            painter.setBrush(QBrush(self.color, Qt.BDiagPattern))
+            painter.drawRect(self._rect)
         painter.restore()
+        if self.is_lazy:
+            return
         for elem in self:
             elem.draw(painter)
 
     def changeFlag(self):
         super().changeFlag()
+        if self.is_lazy:
+            return
         for elem in self:
             elem.changeFlag()
 
     def deactivate(self):
         super().deactivate()
+        if self.is_lazy:
+            return
         for elem in self:
             elem.deactivate()
 
     def addChild(self, child):
+        self._materialize()
         self._childrens.append(child)
         self._updateRect()
 
     def isSelected(self, point):
+        if self.is_lazy and not self._rect.contains(point):
+            return False
         for elem in self:
             if elem.isSelected(point):
                 return True
         return False
 
     def move_inplace(self, canvas: QRect, dx, dy):
+        self._materialize()
         if super().move_inplace(canvas, dx, dy):
             for elem in self:
                 elem.move_inplace(canvas, dx, dy)
 
     def changesize(self, canvas: QRect, dsize) -> Shape:
+        self._materialize()
         if super().changesize(canvas, dsize):
             for i, elem in enumerate(self):
                 if not elem.changesize(canvas, dsize):
@@ -270,6 +304,10 @@ class Group(Shape):
 
     def save(self) -> ET:
         element = super().save()
+        if self.is_lazy:
+            # children were never touched, copy them back as they were read
+            element.append(self._lazy_items)
+            return element
         items = ET.SubElement(element, 'items')
         for elem in self:
             items.append(elem.save())
@@ -280,8 +318,11 @@ class Group(Shape):
     def _factory_load(self, element: ET):
         group = super()._factory_load(element)
         items = element.find('items')
-        for item in items:
-            group.addChild(Shape.load(item))
+        if self.lazy_load:
+            group._lazy_items = items
+        else:
+            for item in items:
+                group.addChild(Shape.load(item))
         return group
 
 